@@ -2,12 +2,10 @@ from flask import Flask, request, jsonify
 from apscheduler.schedulers.background import BackgroundScheduler
 import atexit
 import json
+import threading
+import time
 import typing as t
 
-from langchain.schema import Document
-
-from database_manager import DBManager
-
 app = Flask(__name__)
 
 MAX_K_RESULTS = 5
@@ -22,11 +20,73 @@ def load_config_from_file(config_file: str) -> dict:
 
 
 config = load_config_from_file(CONFIG_FILE_PATH)
-db_manager = DBManager(
-    model_config=config['embedding_model_name'],
-    database_config=config['db_handler']
-)
-db_manager.update_database()
+db_manager = None
+db_ready = threading.Event()
+startup_status = {'error': None, 'timings': {}}
+
+
+def warm_up_database():
+    '''
+    Import the heavy ML dependencies, load the embedding model and build the index in the background,
+    so the server can bind its port and answer health checks right away.
+    The time spent in each stage is recorded in startup_status and exposed by the /ready endpoint.
+    '''
+    global db_manager
+    try:
+        start = time.perf_counter()
+        from database_manager import DBManager  # pulls in torch, sentence-transformers, faiss and langchain
+        startup_status['timings']['import_seconds'] = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        manager = DBManager(
+            model_config=config['embedding_model_name'],
+            database_config=config['db_handler']
+        )
+        startup_status['timings']['model_load_seconds'] = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        manager.update_database()
+        startup_status['timings']['index_warm_up_seconds'] = round(time.perf_counter() - start, 3)
+    except Exception as e:
+        startup_status['error'] = repr(e)
+        app.logger.exception('Database warm-up failed')
+        return
+
+    db_manager = manager
+    db_ready.set()
+    app.logger.info('Database ready: %s', startup_status['timings'])
+
+
+@app.route('/health', methods=['GET'])
+def health():
+    '''
+    Liveness check, answers as soon as the server is up.
+    Returns 500 if the background warm-up failed, so the supervisor restarts the process.
+    '''
+    if startup_status['error']:
+        return jsonify({'status': 'error', 'error': startup_status['error']}), 500
+    return jsonify({'status': 'ok'})
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    '''
+    Readiness check, returns 200 once the embedding model is loaded and the index is warmed up, 503 otherwise.
+
+    The response contains the warm-up status and the time spent in each startup stage:
+    {
+        "ready",
+        "error",
+        "timings": {
+            "import_seconds",
+            "model_load_seconds",
+            "index_warm_up_seconds"
+        }
+    }
+    '''
+    is_ready = db_ready.is_set()
+    body = {'ready': is_ready, 'error': startup_status['error'], 'timings': startup_status['timings']}
+    return jsonify(body), 200 if is_ready else 503
 
 
 @app.route('/similarity_search_with_score', methods=['GET'])
@@ -59,6 +119,9 @@ def similarity_search_with_score() -> t.Dict[str, t.List[t.Dict]]:
         ]
     }
     '''
+    if not db_ready.is_set():
+        return jsonify({'error': 'The database is still loading, please try again later.'}), 503
+
     query = request.args.get('query', '')
     course_name = request.args.get('course_name', '')
 
@@ -68,6 +131,8 @@ def similarity_search_with_score() -> t.Dict[str, t.List[t.Dict]]:
 
 def update_database():
     ''' Function to update the database. This function is called by the scheduler at regular intervals. '''
+    if not db_ready.is_set():
+        return
     db_manager.update_database()
 
 
@@ -77,5 +142,7 @@ scheduler.start()
 
 atexit.register(lambda: scheduler.shutdown())
 
+threading.Thread(target=warm_up_database, name='database-warm-up', daemon=True).start()
+
 if __name__ == '__main__':
     app.run(debug=False, port=5001)
@@ -1,11 +1,42 @@
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
-from chat_bot import ChatBot
+import threading
+import time
 
 app = Flask(__name__)
 CORS(app)
 
-chatbot = ChatBot(enable_gemini=True)
+chatbot = None
+chatbot_ready = threading.Event()
+startup_status = {'error': None, 'timings': {}}
+
+
+def load_chatbot():
+    '''
+    Import the LangChain dependencies and build the LLM client in the background,
+    so the server can bind its port and answer health checks right away.
+    The time spent in each stage is recorded in startup_status and exposed by the /ready endpoint.
+    '''
+    global chatbot
+    try:
+        start = time.perf_counter()
+        from chat_bot import ChatBot
+        startup_status['timings']['import_seconds'] = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        bot = ChatBot(enable_gemini=True)
+        startup_status['timings']['llm_init_seconds'] = round(time.perf_counter() - start, 3)
+    except Exception as e:
+        startup_status['error'] = repr(e)
+        app.logger.exception('Chatbot initialization failed')
+        return
+
+    chatbot = bot
+    chatbot_ready.set()
+    app.logger.info('Chatbot ready: %s', startup_status['timings'])
+
+
+threading.Thread(target=load_chatbot, name='chatbot-init', daemon=True).start()
 
 
 @app.route('/')
@@ -13,6 +44,37 @@ def index():
     return send_from_directory('', 'index.html')
 
 
+@app.route('/health', methods=['GET'])
+def health():
+    '''
+    Liveness check, answers as soon as the server is up.
+    Returns 500 if the background warm-up failed, so the supervisor restarts the process.
+    '''
+    if startup_status['error']:
+        return jsonify({'status': 'error', 'error': startup_status['error']}), 500
+    return jsonify({'status': 'ok'})
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    '''
+    Readiness check, returns 200 once the LLM client is initialized, 503 otherwise.
+
+    The response contains the initialization status and the time spent in each startup stage:
+    {
+        "ready",
+        "error",
+        "timings": {
+            "import_seconds",
+            "llm_init_seconds"
+        }
+    }
+    '''
+    is_ready = chatbot_ready.is_set()
+    body = {'ready': is_ready, 'error': startup_status['error'], 'timings': startup_status['timings']}
+    return jsonify(body), 200 if is_ready else 503
+
+
 @app.route('/api/answer_question', methods=['GET'])
 def ask_question():
     """
@@ -48,10 +110,16 @@ def ask_question():
     course_name = request.args.get('course_name', '')
     if not question or not course_name:
         return jsonify({"error": "Please provide a question and a course name."}), 400
+    if not chatbot_ready.is_set():
+        return jsonify({"error": "The chatbot is still loading, please try again later."}), 503
 
-    answer, metadata_info = chatbot.answer_question(question, course_name)
+    from chat_bot import DatabaseNotReadyError  # already loaded by load_chatbot
+    try:
+        answer, metadata_info = chatbot.answer_question(question, course_name)
+    except DatabaseNotReadyError:
+        return jsonify({"error": "The database is still loading, please try again later."}), 503
     return jsonify({
-        "answer": answer.content,
+        "answer": answer,
         "metadata_list": metadata_info,
     })
 
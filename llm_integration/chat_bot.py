@@ -4,10 +4,12 @@ import os
 import typing as t
 from dotenv import load_dotenv
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.llms import HuggingFaceHub
 from langchain import PromptTemplate
 
+if t.TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain.llms import HuggingFaceHub
+
 load_dotenv()
 
 CONFIG_INDEX = 1
@@ -21,6 +23,10 @@ PROMPT_TEMPLATE = (
 )
 
 
+class DatabaseNotReadyError(Exception):
+    ''' Raised when the database service is still loading and cannot answer similarity searches yet. '''
+
+
 class ChatBot:
     '''
     A class to represent the ChatBot.
@@ -32,9 +38,13 @@ class ChatBot:
                                               input_variables=["context", "question"]
                                               )
 
-    def initialize_llm(self, enable_gemini: bool) -> t.Union[HuggingFaceHub, ChatGoogleGenerativeAI]:
-        ''' Initialize the LLM model based on the configuration file or the gemini-1.5-flash model. '''
+    def initialize_llm(self, enable_gemini: bool) -> t.Union['HuggingFaceHub', 'ChatGoogleGenerativeAI']:
+        '''
+        Initialize the LLM model based on the configuration file or the gemini-1.5-flash model.
+        Only the client of the selected provider is imported.
+        '''
         if enable_gemini:
+            from langchain_google_genai import ChatGoogleGenerativeAI
             return ChatGoogleGenerativeAI(model="gemini-1.5-flash",
                                           temperature=0.1,
                                           max_tokens=None,
@@ -42,6 +52,7 @@ class ChatBot:
                                           max_retries=2,
                                           )
         else:
+            from langchain.llms import HuggingFaceHub
             configs_lst = self.load_config_from_file()
             config = configs_lst[CONFIG_INDEX]
             return HuggingFaceHub(repo_id=config["llm_model_name"],
@@ -67,8 +78,13 @@ class ChatBot:
                                     "metadata": dict,
                                     "score": float
                                 }
+
+        Raises:
+            DatabaseNotReadyError: If the database service is still loading.
         '''
         response = requests.get(DB_SEARCH_ENDPOINT, params={'query': query, "course_name": course_name})
+        if response.status_code == 503:
+            raise DatabaseNotReadyError(response.text)
         if response.status_code != 200:
             return f"An error occurred: {response.text}", {}
         response_data = response.json()
@@ -76,7 +92,7 @@ class ChatBot:
         db_data = response_data['docs_and_scores']
         formatted_prompt = self.format_prompt(db_data, query)
         answer = self.llm.invoke(formatted_prompt)
-        return answer, db_data
+        return getattr(answer, 'content', answer), db_data
 
     def format_prompt(self, db_data: str, question: str) -> str:
         ''' Format the prompt based on the retrieved data and the question. '''